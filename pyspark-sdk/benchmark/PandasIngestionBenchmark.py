@@ -0,0 +1,79 @@
+# Compares the time to hand a pandas DataFrame to the JVM via the vectorized path of FeatureStoreManager against the
+# plain ``spark.createDataFrame`` route. No data is ingested, so no AWS resource is required.
+#
+# Usage: python PandasIngestionBenchmark.py [number of records]
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pyspark import SparkConf, SparkContext
+from pyspark.sql import SparkSession
+
+from feature_store_pyspark import classpath_jars
+from feature_store_pyspark.FeatureStoreManager import (
+    ARROW_ENABLED_CONF,
+    ARROW_FALLBACK_ENABLED_CONF,
+    prepare_input_data,
+)
+
+os.environ['SPARK_CLASSPATH'] = ":".join(classpath_jars())
+conf = (SparkConf().set("spark.driver.extraClassPath", os.environ['SPARK_CLASSPATH']))
+spark = SparkSession(SparkContext(conf=conf))
+
+FEATURE_TYPES = {
+    "record_identifier": "String",
+    "event_time": "String",
+    "feature_integral": "Integral",
+    "feature_fractional": "Fractional",
+    "feature_string": "String",
+}
+
+
+def generate_data(number_of_records: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "record_identifier": [f"identifier-{i}" for i in range(number_of_records)],
+        "event_time": ["2021-05-06T05:12:14Z"] * number_of_records,
+        "feature_integral": np.arange(number_of_records),
+        "feature_fractional": np.random.rand(number_of_records),
+        "feature_string": np.random.choice(["a", "b", "c"], number_of_records),
+    })
+
+
+def create_data_frame_route(input_data: pd.DataFrame):
+    # What users do today before calling ``ingest_data``, with spark's default configuration
+    spark.conf.unset(ARROW_ENABLED_CONF)
+    spark.conf.unset(ARROW_FALLBACK_ENABLED_CONF)
+    return spark.createDataFrame(input_data)
+
+
+def vectorized_route(input_data: pd.DataFrame):
+    # Same as ``FeatureStoreManager._to_spark_data_frame`` without describing the feature group
+    prepared_data, schema = prepare_input_data(input_data, FEATURE_TYPES, "record_identifier", "event_time")
+    spark.conf.set(ARROW_ENABLED_CONF, "true")
+    spark.conf.set(ARROW_FALLBACK_ENABLED_CONF, "false")
+    return spark.createDataFrame(prepared_data, schema)
+
+
+def benchmark(route, input_data: pd.DataFrame, repeats: int = 3) -> float:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        # count forces the data to be materialized in the JVM
+        route(input_data).count()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+if __name__ == "__main__":
+    number_of_records = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    data = generate_data(number_of_records)
+
+    create_data_frame_seconds = benchmark(create_data_frame_route, data)
+    vectorized_seconds = benchmark(vectorized_route, data)
+
+    print(f"records: {number_of_records}")
+    print(f"spark.createDataFrame: {create_data_frame_seconds:.2f}s")
+    print(f"validation + arrow: {vectorized_seconds:.2f}s")
+    print(f"speedup: {create_data_frame_seconds / vectorized_seconds:.1f}x")
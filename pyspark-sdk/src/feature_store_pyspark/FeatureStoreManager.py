@@ -12,18 +12,38 @@
 # permissions and limitations under the License.
 
 import string
-from typing import List
-from pyspark.sql import DataFrame
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.types import DoubleType, LongType, StringType, StructField, StructType
 
+from feature_store_pyspark.IngestionJob import IngestionJob
+from feature_store_pyspark.InputDataSchemaValidator import validate_input_data
 from feature_store_pyspark.wrapper import SageMakerFeatureStoreJavaWrapper
 
 
+FEATURE_TYPE_TO_SPARK_TYPE_MAP = {
+    "Integral": LongType(),
+    "Fractional": DoubleType(),
+    "String": StringType(),
+}
+ARROW_ENABLED_CONF = "spark.sql.execution.arrow.pyspark.enabled"
+ARROW_FALLBACK_ENABLED_CONF = "spark.sql.execution.arrow.pyspark.fallback.enabled"
+
+# Arrow confs are set on the session shared by concurrent ingestions, so they are only changed by one thread at a time
+_ARROW_CONVERSION_LOCK = threading.Lock()
+
+
 class FeatureStoreManager(SageMakerFeatureStoreJavaWrapper):
     """A central manager for fature store data reporitory.
 
     ``ingest_data`` can be used to do batch data ingestion into the specified feature group. The input data should be in
     the format of spark DataFrame and feature_group_arn is the specified feature group's arn. To selectively ingest to
-    offline/online store, specify the ``target_stores`` according to different use cases.
+    offline/online store, specify the ``target_stores`` according to different use cases. ``ingest_data_async`` does the
+    same ingestion without blocking and returns an ``IngestionJob`` handle. Besides spark DataFrame, both methods accept
+    pandas DataFrame and Arrow table, which are validated in vectorized form and handed to the JVM as Arrow batches.
     """
     _wrapped_class = "software.amazon.sagemaker.featurestore.sparksdk.FeatureStoreManager"
 
@@ -35,14 +55,53 @@ class FeatureStoreManager(SageMakerFeatureStoreJavaWrapper):
         """
         Batch ingest data into SageMaker FeatureStore.
 
-        :param input_data_frame (DataFrame): the DataFrame to be ingested.
+        :param input_data_frame (DataFrame, pandas.DataFrame or pyarrow.Table): the data to be ingested.
         :param feature_group_arn (str): target feature group arn.
         :param target_stores (List[str]): a list of target stores which the data should be ingested to.
 
         :return:
         """
+        input_data_frame = self._to_spark_data_frame(input_data_frame, feature_group_arn)
         return self._call_java("ingestDataInJava", input_data_frame, feature_group_arn, target_stores)
 
+    def ingest_data_async(self, input_data_frame: DataFrame, feature_group_arn: str, target_stores: List[str] = None,
+                          scheduler_pool: str = None, count_total_records: bool = True) -> IngestionJob:
+        """
+        Asynchronously ingest data into SageMaker FeatureStore in a dedicated spark scheduler pool.
+
+        :param input_data_frame (DataFrame, pandas.DataFrame or pyarrow.Table): the data to be ingested.
+        :param feature_group_arn (str): target feature group arn.
+        :param target_stores (List[str]): a list of target stores which the data should be ingested to.
+        :param scheduler_pool (str): spark scheduler pool to run the ingestion, a pool named after the feature group is
+            used if not specified.
+        :param count_total_records (bool): count the input data before ingestion to report progress against the total
+            number of records. Counting is an extra pass over the input, if disabled the total is reported as -1 and
+            ingestions only into OfflineStore report no progress.
+
+        :return: the handle of the ingestion job.
+        """
+        input_data_frame = self._to_spark_data_frame(input_data_frame, feature_group_arn)
+        return IngestionJob(self._call_java("ingestDataAsyncInJava", input_data_frame, feature_group_arn, target_stores,
+                                            scheduler_pool, count_total_records))
+
+    def delete_records(self, input_data_frame: DataFrame, feature_group_arn: str, event_time: str = None,
+                       target_stores: List[str] = None, deletion_mode: str = None, concurrency_per_task: int = None):
+        """
+        Delete records from SageMaker FeatureStore.
+
+        :param input_data_frame (DataFrame): the DataFrame which contains record identifiers of records to be deleted.
+        :param feature_group_arn (str): target feature group arn.
+        :param event_time (str): event time of the deletion, current time is used if not specified.
+        :param target_stores (List[str]): a list of target stores which the records should be deleted from.
+        :param deletion_mode (str): deletion mode, either 'SoftDelete' or 'HardDelete'.
+        :param concurrency_per_task (int): maximum number of DeleteRecord requests in flight within each spark task,
+            16 if not specified.
+
+        :return:
+        """
+        return self._call_java("deleteRecordsInJava", input_data_frame, feature_group_arn, event_time, target_stores,
+                               deletion_mode, concurrency_per_task)
+
     def load_feature_definitions_from_schema(self, input_data_frame: DataFrame):
         """
         Load feature definitions according to the schema of input DataFrame.
@@ -64,3 +123,97 @@ class FeatureStoreManager(SageMakerFeatureStoreJavaWrapper):
         :return: the DataFrame of records that fail to be ingested.
         """
         return self._call_java("getFailedStreamIngestionDataFrame")
+
+    def get_failed_delete_records_data_frame(self) -> DataFrame:
+        """
+        Retrieve DataFrame which includes all records fail to be deleted via ``delete_records`` method.
+
+        :return: the DataFrame of records that fail to be deleted.
+        """
+        return self._call_java("getFailedDeleteRecordsDataFrame")
+
+    def _to_spark_data_frame(self, input_data, feature_group_arn: str) -> DataFrame:
+        """
+        Validate pandas DataFrame or Arrow table against the feature definitions and convert it to spark DataFrame via
+        Arrow record batches, any other input is returned as it is.
+
+        :param input_data: the data to be ingested.
+        :param feature_group_arn (str): target feature group arn.
+
+        :return: the spark DataFrame to be ingested.
+        """
+        if not _is_pandas_or_arrow(input_data):
+            return input_data
+
+        describe_response = self._call_java("describeFeatureGroup", feature_group_arn)
+        feature_types = {
+            definition.featureName(): definition.featureTypeAsString()
+            for definition in describe_response.featureDefinitions()
+        }
+        prepared_data, schema = prepare_input_data(
+            input_data,
+            feature_types,
+            describe_response.recordIdentifierFeatureName(),
+            describe_response.eventTimeFeatureName()
+        )
+
+        spark = SparkSession.builder.getOrCreate()
+        with _arrow_conversion_enabled(spark):
+            return spark.createDataFrame(prepared_data, schema)
+
+
+def prepare_input_data(input_data, feature_types: Dict[str, str], record_identifier_name: str,
+                       event_time_feature_name: str) -> Tuple:
+    """
+    Validate pandas DataFrame or Arrow table against the feature types and prepare it to be converted to spark DataFrame
+    via Arrow record batches.
+
+    :param input_data (pandas.DataFrame or pyarrow.Table): the data to be ingested.
+    :param feature_types (Dict[str, str]): feature types of feature group keyed by feature name.
+    :param record_identifier_name (str): record identifier feature name of feature group.
+    :param event_time_feature_name (str): event time feature name of feature group.
+
+    :return: a tuple of the pandas DataFrame and the schema to create spark DataFrame with.
+    """
+    validated_data = validate_input_data(input_data, feature_types, record_identifier_name, event_time_feature_name)
+    schema = StructType([
+        StructField(name, FEATURE_TYPE_TO_SPARK_TYPE_MAP[feature_types[name]]) for name in validated_data.columns
+    ])
+
+    # Spark converts pandas columns to Arrow with a null mask, which nullable Int64 columns do not support, so they
+    # are handed over as python integers to stay exact
+    for name in validated_data.columns:
+        if validated_data[name].dtype.name == "Int64":
+            values = validated_data[name]
+            validated_data[name] = values.astype(object).where(values.notna(), None) if values.hasnans \
+                else values.astype("int64")
+
+    return validated_data, schema
+
+
+def _is_pandas_or_arrow(input_data) -> bool:
+    # pandas and pyarrow are optional, if they are not imported yet the input cannot be one of their types
+    pandas = sys.modules.get("pandas")
+    pyarrow = sys.modules.get("pyarrow")
+
+    return (pandas is not None and isinstance(input_data, pandas.DataFrame)) or \
+        (pyarrow is not None and isinstance(input_data, pyarrow.Table))
+
+
+@contextmanager
+def _arrow_conversion_enabled(spark: SparkSession):
+    # Fallback is disabled so that the data is never converted row by row without being noticed
+    with _ARROW_CONVERSION_LOCK:
+        previous_confs = {
+            conf: spark.conf.get(conf, None) for conf in (ARROW_ENABLED_CONF, ARROW_FALLBACK_ENABLED_CONF)
+        }
+        spark.conf.set(ARROW_ENABLED_CONF, "true")
+        spark.conf.set(ARROW_FALLBACK_ENABLED_CONF, "false")
+        try:
+            yield
+        finally:
+            for conf, value in previous_confs.items():
+                if value is None:
+                    spark.conf.unset(conf)
+                else:
+                    spark.conf.set(conf, value)
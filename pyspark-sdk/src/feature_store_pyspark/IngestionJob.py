@@ -0,0 +1,93 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#   http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+
+import math
+from typing import Dict, Tuple
+from pyspark.sql import DataFrame
+
+from feature_store_pyspark.wrapper import SageMakerFeatureStoreJavaWrapper
+
+
+class IngestionJob(SageMakerFeatureStoreJavaWrapper):
+    """A future-like handle of data ingestion started by ``FeatureStoreManager.ingest_data_async``.
+
+    The ingestion runs in its own spark job group and scheduler pool. Use ``progress`` to check how many records are
+    processed, ``cancel`` to stop it and ``result`` to wait for it to finish.
+    """
+    _wrapped_class = "software.amazon.sagemaker.featurestore.sparksdk.IngestionJob"
+
+    def __init__(self, java_obj):
+        super(IngestionJob, self).__init__()
+        self._java_obj = java_obj
+
+    def status(self) -> str:
+        """
+        Retrieve status of the ingestion.
+
+        :return: one of 'Pending', 'Running', 'Succeeded', 'Failed' and 'Cancelled'.
+        """
+        return self._call_java("status")
+
+    def progress(self) -> Tuple[int, int]:
+        """
+        Retrieve progress of the ingestion.
+
+        :return: a tuple of processed records and total records, total records is -1 if it is not counted yet
+            or counting is disabled.
+        """
+        return self._call_java("ingestedRecords"), self._call_java("totalRecords")
+
+    def done(self) -> bool:
+        """
+        Check if the ingestion is finished, either succeeded, failed or cancelled.
+
+        :return: True if the ingestion is finished.
+        """
+        return self._call_java("isDone")
+
+    def cancel(self):
+        """
+        Request cancellation of the ingestion, running spark jobs of the ingestion are cancelled.
+
+        :return:
+        """
+        return self._call_java("cancel")
+
+    def result(self, timeout: float = None):
+        """
+        Wait for the ingestion to finish and raise its failure if any.
+
+        :param timeout (float): maximum seconds to wait, wait until the ingestion finishes if not specified.
+
+        :return:
+        """
+        if timeout is not None and not self._call_java("awaitCompletion", int(math.ceil(timeout))):
+            raise TimeoutError(f"Ingestion is not finished after {timeout} seconds.")
+        return self._call_java("result")
+
+    def get_failed_stream_ingestion_data_frame(self) -> DataFrame:
+        """
+        Retrieve DataFrame which includes all records of this ingestion fail to be ingested.
+
+        :return: the DataFrame of records that fail to be ingested.
+        """
+        return self._call_java("getFailedStreamIngestionDataFrame")
+
+    def get_report(self) -> Dict[str, str]:
+        """
+        Retrieve report of the ingestion, including status, progress and failure details.
+
+        :return: the report of the ingestion.
+        """
+        return dict(self._call_java("getReport"))
@@ -0,0 +1,250 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#   http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+
+import math
+import re
+from typing import Dict, List
+
+RESERVED_FEATURE_NAMES = {
+    "is_deleted", "write_time", "api_invocation_time", "year", "month", "day", "hour", "temp_event_time_col"
+}
+INVALID_CHAR_SET = "[,;{}()\n\t=]"
+INTEGRAL_MIN_VALUE = -2 ** 63
+INTEGRAL_MAX_VALUE = 2 ** 63 - 1
+# Strings accepted by casting to long in spark, the fractional part is truncated
+INTEGRAL_STRING_PATTERN = re.compile(r"\s*([+-]?[0-9]+)(\.[0-9]*)?\s*")
+MAX_INVALID_RECORDS_TO_SHOW = 20
+
+
+def validate_schema_names(schema_names: List[str], feature_names: List[str], record_identifier_name: str,
+                          event_time_feature_name: str):
+    """
+    Validate column names of input data against the feature definitions of feature group.
+
+    :param schema_names (List[str]): column names of input data.
+    :param feature_names (List[str]): feature names of feature group.
+    :param record_identifier_name (str): record identifier feature name of feature group.
+    :param event_time_feature_name (str): event time feature name of feature group.
+
+    :return:
+    """
+    invalid_char_set_pattern = re.compile(INVALID_CHAR_SET)
+    unknown_columns = []
+
+    for name in schema_names:
+        if invalid_char_set_pattern.search(name):
+            raise ValueError(f"Cannot proceed. Invalid char among '{INVALID_CHAR_SET}' detected in '{name}'.")
+
+        if name in RESERVED_FEATURE_NAMES:
+            raise ValueError(f"Cannot proceed. Detected column with reserved feature name '{name}'.")
+
+        if name not in feature_names:
+            unknown_columns.append(name)
+
+    if unknown_columns:
+        raise ValueError(f"Cannot proceed. Schema contains unknown columns: '{','.join(unknown_columns)}'")
+
+    missing_required_feature_names = [
+        name for name in (record_identifier_name, event_time_feature_name) if name not in schema_names
+    ]
+    if missing_required_feature_names:
+        raise ValueError(
+            f"Cannot proceed. Missing feature names '{','.join(missing_required_feature_names)}' in schema."
+        )
+
+
+def validate_input_data(input_data, feature_types: Dict[str, str], record_identifier_name: str,
+                        event_time_feature_name: str):
+    """
+    Validate pandas DataFrame or Arrow table in vectorized form, the rules are the same as validating Spark DataFrame.
+
+    Values of each column must be convertible to its feature type and must not be NaN, record identifier and event
+    time must not be missing. Since pandas does not distinguish NaN from missing values, NaN of pandas DataFrame is
+    treated as missing value.
+
+    :param input_data (pandas.DataFrame or pyarrow.Table): input data to be validated.
+    :param feature_types (Dict[str, str]): feature types of feature group keyed by feature name.
+    :param record_identifier_name (str): record identifier feature name of feature group.
+    :param event_time_feature_name (str): event time feature name of feature group.
+
+    :return: pandas DataFrame whose columns are converted to the corresponding feature types.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        raise ImportError(
+            "Pandas is required to ingest pandas DataFrame or Arrow table. Install it with: pip install pandas pyarrow"
+        )
+
+    nan_masks = {}
+    if not isinstance(input_data, pd.DataFrame):
+        nan_masks = _get_arrow_nan_masks(input_data)
+        input_data = input_data.to_pandas(types_mapper=_arrow_integer_types_mapper)
+
+    schema_names = [str(name) for name in input_data.columns]
+    validate_schema_names(schema_names, list(feature_types.keys()), record_identifier_name, event_time_feature_name)
+
+    validated_columns = {}
+    invalid_masks = {}
+    for name in schema_names:
+        values = input_data[name].reset_index(drop=True)
+        converted_values, invalid_mask = _convert_values(values, feature_types[name])
+
+        if name == event_time_feature_name and feature_types[name] == "String":
+            invalid_mask = invalid_mask | _get_invalid_timestamp_mask(values)
+        if name in (record_identifier_name, event_time_feature_name):
+            invalid_mask = invalid_mask | values.isna().to_numpy()
+        if name in nan_masks:
+            invalid_mask = invalid_mask | nan_masks[name]
+
+        validated_columns[name] = converted_values
+        invalid_masks[name] = invalid_mask
+
+    invalid_records = np.logical_or.reduce(list(invalid_masks.values()))
+    if invalid_records.any():
+        raise ValueError(
+            "Cannot proceed. Some records contain columns with data types that are not registered in the FeatureGroup "
+            "or records values equal to NaN.\n" +
+            _format_invalid_records(input_data, invalid_records, invalid_masks, record_identifier_name)
+        )
+
+    return pd.DataFrame(validated_columns)
+
+
+def _convert_values(values, feature_type: str):
+    import numpy as np
+    import pandas as pd
+
+    if feature_type == "String":
+        if pd.api.types.is_bool_dtype(values) or pd.api.types.is_object_dtype(values):
+            # Booleans are spelled the same as casting them to string in spark
+            values = pd.Series([
+                str(value).lower() if isinstance(value, (bool, np.bool_)) else value for value in values.tolist()
+            ], index=values.index, dtype=object)
+        converted_values = values.astype(str).astype(object).where(values.notna(), None)
+        return converted_values, np.zeros(len(values), dtype=bool)
+
+    if feature_type == "Integral":
+        return _convert_integral_values(values)
+
+    if pd.api.types.is_bool_dtype(values):
+        values = values.astype("float64")
+    numeric_values = pd.to_numeric(values, errors="coerce").astype("float64")
+    invalid_mask = (numeric_values.isna() & values.notna()).to_numpy()
+
+    return numeric_values, invalid_mask
+
+
+def _convert_integral_values(values):
+    import numpy as np
+    import pandas as pd
+
+    # Integers are kept as nullable Int64 since float64 cannot represent integers beyond 2 ** 53 exactly
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype("Int64"), np.zeros(len(values), dtype=bool)
+
+    if pd.api.types.is_integer_dtype(values):
+        invalid_mask = np.zeros(len(values), dtype=bool)
+        if pd.api.types.is_unsigned_integer_dtype(values):
+            invalid_mask = (values > INTEGRAL_MAX_VALUE).fillna(False).to_numpy(dtype=bool)
+            if invalid_mask.any():
+                return values, invalid_mask
+
+        return values.astype("Int64"), invalid_mask
+
+    if pd.api.types.is_float_dtype(values):
+        numeric_values = values.astype("float64")
+        # INTEGRAL_MAX_VALUE is rounded up to 2 ** 63 in float64, so the upper bound is exclusive
+        invalid_mask = ((numeric_values < INTEGRAL_MIN_VALUE) | (numeric_values >= 2.0 ** 63)).to_numpy()
+        return np.trunc(numeric_values).where(~invalid_mask).astype("Int64"), invalid_mask
+
+    # Strings and python objects are parsed one by one into python integers, which keeps integers of any size exact
+    present_mask = values.notna().to_numpy()
+    integral_values = [
+        _parse_integral_value(value) if present else None for value, present in zip(values.tolist(), present_mask)
+    ]
+    invalid_mask = np.array([
+        present and (value is None or not INTEGRAL_MIN_VALUE <= value <= INTEGRAL_MAX_VALUE)
+        for value, present in zip(integral_values, present_mask)
+    ], dtype=bool)
+    integral_values = [None if invalid else value for value, invalid in zip(integral_values, invalid_mask)]
+
+    return pd.Series(pd.array(integral_values, dtype="Int64"), index=values.index), invalid_mask
+
+
+def _parse_integral_value(value):
+    import numpy as np
+
+    if isinstance(value, (bool, np.bool_, int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        match = INTEGRAL_STRING_PATTERN.fullmatch(value)
+        return int(match.group(1)) if match else None
+    if isinstance(value, (float, np.floating)) and math.isfinite(value):
+        return int(value)
+
+    return None
+
+
+def _get_invalid_timestamp_mask(values):
+    import pandas as pd
+
+    string_values = values.astype(str).where(values.notna(), None)
+    try:
+        timestamps = pd.to_datetime(string_values, errors="coerce", utc=True, format="ISO8601")
+    except (TypeError, ValueError):
+        # format 'ISO8601' is only supported since pandas 2.0
+        timestamps = pd.to_datetime(string_values, errors="coerce", utc=True)
+
+    return (timestamps.isna() & values.notna()).to_numpy()
+
+
+def _arrow_integer_types_mapper(arrow_type):
+    import pandas as pd
+    import pyarrow as pa
+
+    # Integer columns with nulls are converted to float64 by default, which loses precision beyond 2 ** 53
+    if pa.types.is_uint64(arrow_type):
+        return pd.UInt64Dtype()
+    if pa.types.is_integer(arrow_type):
+        return pd.Int64Dtype()
+
+    return None
+
+
+def _get_arrow_nan_masks(input_table) -> Dict:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    nan_masks = {}
+    for field in input_table.schema:
+        if pa.types.is_floating(field.type):
+            is_nan = pc.fill_null(pc.is_nan(input_table.column(field.name)), False)
+            nan_masks[str(field.name)] = is_nan.to_numpy(zero_copy_only=False).astype(bool)
+
+    return nan_masks
+
+
+def _format_invalid_records(input_data, invalid_records, invalid_masks, record_identifier_name) -> str:
+    import numpy as np
+
+    invalid_positions = np.flatnonzero(invalid_records)[:MAX_INVALID_RECORDS_TO_SHOW]
+    identifiers = input_data[record_identifier_name].to_numpy()
+
+    return "\n".join(
+        f"{identifiers[position]}: " +
+        ",".join(f"{name} not valid" for name, invalid_mask in invalid_masks.items() if invalid_mask[position])
+        for position in invalid_positions
+    )
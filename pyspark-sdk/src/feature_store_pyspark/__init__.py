@@ -54,4 +54,4 @@ def classpath_jars():
     return jars
 
 
-__all__ = ['FeatureStoreManager', 'classpath_jars', 'wrapper']
+__all__ = ['FeatureStoreManager', 'IngestionJob', 'classpath_jars', 'wrapper']
@@ -1,13 +1,23 @@
 import os
+import threading
+import time
 
+import pandas as pd
+import pyarrow as pa
 from pyspark import SparkConf, SparkContext
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from pyspark.sql import SparkSession
 from pyspark.sql.types import StructType, StructField, LongType, DoubleType, StringType
 
 from feature_store_pyspark import classpath_jars
-from feature_store_pyspark.FeatureStoreManager import FeatureStoreManager
+from feature_store_pyspark.FeatureStoreManager import (
+    ARROW_ENABLED_CONF,
+    FeatureStoreManager,
+    _arrow_conversion_enabled,
+    prepare_input_data,
+)
+from feature_store_pyspark.IngestionJob import IngestionJob
 
 os.environ['SPARK_CLASSPATH'] = ":".join(classpath_jars())
 
@@ -31,6 +41,50 @@ def test_feature_store_manager_methods():
         feature_store_manager.get_failed_stream_ingestion_data_frame()
         java_method_invocation.assert_called_with("getFailedStreamIngestionDataFrame")
 
+        feature_store_manager.delete_records(None, "test-arn", "2021-05-06T05:12:14Z", ["OnlineStore"], "HardDelete", 4)
+        java_method_invocation.assert_called_with("deleteRecordsInJava", None, "test-arn", "2021-05-06T05:12:14Z",
+                                                  ["OnlineStore"], "HardDelete", 4)
+
+        feature_store_manager.get_failed_delete_records_data_frame()
+        java_method_invocation.assert_called_with("getFailedDeleteRecordsDataFrame")
+
+
+def test_ingest_data_async():
+    feature_store_manager = FeatureStoreManager()
+
+    with patch('pyspark.ml.wrapper.JavaWrapper._call_java') as java_method_invocation:
+        ingestion_job = feature_store_manager.ingest_data_async(None, "test-arn", ["OnlineStore"], "test-pool", False)
+        java_method_invocation.assert_called_with("ingestDataAsyncInJava", None, "test-arn", ["OnlineStore"],
+                                                  "test-pool", False)
+        assert isinstance(ingestion_job, IngestionJob)
+
+
+def test_ingestion_job_methods():
+    ingestion_job = IngestionJob(None)
+
+    with patch('pyspark.ml.wrapper.JavaWrapper._call_java') as java_method_invocation:
+        ingestion_job.status()
+        java_method_invocation.assert_called_with("status")
+
+        ingestion_job.cancel()
+        java_method_invocation.assert_called_with("cancel")
+
+        ingestion_job.get_failed_stream_ingestion_data_frame()
+        java_method_invocation.assert_called_with("getFailedStreamIngestionDataFrame")
+
+        java_method_invocation.return_value = {"Status": "Succeeded"}
+        assert ingestion_job.get_report() == {"Status": "Succeeded"}
+
+        java_method_invocation.return_value = 10
+        assert ingestion_job.progress() == (10, 10)
+
+        java_method_invocation.return_value = False
+        try:
+            ingestion_job.result(timeout=1)
+            assert False
+        except TimeoutError:
+            java_method_invocation.assert_called_with("awaitCompletion", 1)
+
 
 def test_load_feature_definitions_from_schema():
     feature_store_manager = FeatureStoreManager()
@@ -56,3 +110,88 @@ def test_load_feature_definitions_from_schema():
             'FeatureType': 'String'
         },
     ]
+
+
+def test_ingest_pandas_data_frame():
+    feature_store_manager = FeatureStoreManager()
+    describe_response = MagicMock()
+    describe_response.recordIdentifierFeatureName.return_value = "record-identifier"
+    describe_response.eventTimeFeatureName.return_value = "event-time"
+    feature_definitions = []
+    for feature_name, feature_type in [("record-identifier", "String"), ("event-time", "String"),
+                                       ("feature-integral", "Integral"), ("feature-fractional", "Fractional")]:
+        feature_definition = MagicMock()
+        feature_definition.featureName.return_value = feature_name
+        feature_definition.featureTypeAsString.return_value = feature_type
+        feature_definitions.append(feature_definition)
+    describe_response.featureDefinitions.return_value = feature_definitions
+
+    input_data = pd.DataFrame({
+        "record-identifier": ["identifier-1", "identifier-2"],
+        "event-time": ["2021-05-06T05:12:14Z", "2021-05-06T05:12:14Z"],
+        "feature-integral": [1.0, None],
+        "feature-fractional": ["1.5", None],
+    })
+
+    with patch('pyspark.ml.wrapper.JavaWrapper._call_java') as java_method_invocation:
+        java_method_invocation.side_effect = \
+            lambda name, *args: describe_response if name == "describeFeatureGroup" else None
+
+        large_integral_data = input_data.assign(**{"feature-integral": pd.array([2 ** 53 + 1, None], dtype="Int64")})
+        for data, expected_integral in [(input_data, 1), (pa.Table.from_pandas(input_data), 1),
+                                        (pa.Table.from_pandas(large_integral_data), 2 ** 53 + 1)]:
+            feature_store_manager.ingest_data(data, "test-arn", ["OnlineStore"])
+
+            name, ingested_data_frame, feature_group_arn, target_stores = java_method_invocation.call_args[0]
+            assert name == "ingestDataInJava"
+            assert ingested_data_frame.schema == StructType([
+                StructField("record-identifier", StringType()),
+                StructField("event-time", StringType()),
+                StructField("feature-integral", LongType()),
+                StructField("feature-fractional", DoubleType()),
+            ])
+            assert [tuple(row) for row in ingested_data_frame.collect()] == [
+                ("identifier-1", "2021-05-06T05:12:14Z", expected_integral, 1.5),
+                ("identifier-2", "2021-05-06T05:12:14Z", None, None),
+            ]
+
+
+def test_prepare_input_data():
+    input_data = pd.DataFrame({
+        "record-identifier": ["identifier-1", "identifier-2"],
+        "event-time": ["2021-05-06T05:12:14Z", "2021-05-06T05:12:14Z"],
+        "feature-integral": [1, 2],
+        "feature-nullable-integral": pd.array([2 ** 53 + 1, None], dtype="Int64"),
+    })
+    feature_types = {"record-identifier": "String", "event-time": "String", "feature-integral": "Integral",
+                     "feature-nullable-integral": "Integral"}
+
+    prepared_data, schema = prepare_input_data(input_data, feature_types, "record-identifier", "event-time")
+
+    # Nullable Int64 columns cannot be converted by spark with Arrow enabled
+    assert prepared_data["feature-integral"].dtype == "int64"
+    assert list(prepared_data["feature-nullable-integral"]) == [2 ** 53 + 1, None]
+    assert schema["feature-nullable-integral"].dataType == LongType()
+
+
+def test_arrow_conversion_enabled_with_concurrent_ingestions():
+    confs = {}
+    spark_session = MagicMock()
+    spark_session.conf.get.side_effect = lambda conf, default: confs.get(conf, default)
+    spark_session.conf.set.side_effect = confs.__setitem__
+    spark_session.conf.unset.side_effect = confs.pop
+    observed_confs = []
+
+    def convert():
+        with _arrow_conversion_enabled(spark_session):
+            time.sleep(0.01)
+            observed_confs.append(confs.get(ARROW_ENABLED_CONF))
+
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert observed_confs == ["true"] * 4
+    assert confs == {}
@@ -0,0 +1,112 @@
+import math
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feature_store_pyspark.InputDataSchemaValidator import validate_input_data, validate_schema_names
+
+FEATURE_TYPES = {
+    "record-identifier": "String",
+    "event-time": "String",
+    "feature-integral": "Integral",
+    "feature-fractional": "Fractional",
+    "feature-string": "String",
+}
+
+
+def test_validate_input_data():
+    input_data = pd.DataFrame({
+        "record-identifier": ["identifier-1", "identifier-2"],
+        "event-time": ["2021-05-06T05:12:14Z", "2021-05-06T05:12:14.123Z"],
+        "feature-integral": ["1", None],
+        "feature-fractional": [1, None],
+        "feature-string": [1.5, None],
+    })
+
+    validated_data = validate_input_data(input_data, FEATURE_TYPES, "record-identifier", "event-time")
+
+    assert validated_data["feature-integral"].dtype == "Int64"
+    assert validated_data["feature-fractional"].dtype == "float64"
+    assert validated_data["feature-integral"][0] == 1
+    assert validated_data["feature-integral"].isna()[1]
+    assert math.isnan(validated_data["feature-fractional"][1])
+    assert list(validated_data["feature-string"]) == ["1.5", None]
+
+
+@pytest.mark.parametrize("string_values", [
+    [True, False, None],
+    pd.array([True, False, None], dtype="boolean"),
+    pd.Series([True, False, None], dtype=object),
+    pa.array([True, False, None]),
+])
+def test_validate_input_data_boolean_string(string_values):
+    input_data = {"record-identifier": ["identifier-1", "identifier-2", "identifier-3"],
+                  "event-time": ["2021-05-06T05:12:14Z"] * 3,
+                  "feature-string": string_values}
+    input_data = pa.table(input_data) if isinstance(string_values, pa.Array) else pd.DataFrame(input_data)
+
+    validated_data = validate_input_data(input_data, FEATURE_TYPES, "record-identifier", "event-time")
+
+    # Same as casting boolean to string in spark
+    assert list(validated_data["feature-string"]) == ["true", "false", None]
+
+
+@pytest.mark.parametrize("integral_values,expected_value", [
+    (pd.array([2 ** 53 + 1, None], dtype="Int64"), 2 ** 53 + 1),
+    (pa.array([2 ** 53 + 1, None]), 2 ** 53 + 1),
+    (pa.array([2 ** 53 + 1, None], pa.uint64()), 2 ** 53 + 1),
+    (["9007199254740993", None], 2 ** 53 + 1),
+    (pd.Series([2 ** 53 + 1, None], dtype=object), 2 ** 53 + 1),
+    (["9223372036854775807", None], 2 ** 63 - 1),
+    ([" -9223372036854775808 ", None], -2 ** 63),
+    (["1.9", None], 1),
+])
+def test_validate_input_data_nullable_integral(integral_values, expected_value):
+    input_data = {"record-identifier": ["identifier-1", "identifier-2"],
+                  "event-time": ["2021-05-06T05:12:14Z", "2021-05-06T05:12:14Z"],
+                  "feature-integral": integral_values}
+    input_data = pa.table(input_data) if isinstance(integral_values, pa.Array) else pd.DataFrame(input_data)
+
+    validated_data = validate_input_data(input_data, FEATURE_TYPES, "record-identifier", "event-time")
+
+    assert validated_data["feature-integral"].dtype == "Int64"
+    assert validated_data["feature-integral"][0] == expected_value
+    assert validated_data["feature-integral"].isna()[1]
+
+
+@pytest.mark.parametrize("input_data", [
+    pd.DataFrame({"record-identifier": [None], "event-time": ["2021-05-06T05:12:14Z"]}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["not-a-timestamp"]}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+                  "feature-integral": ["dummy"]}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+                  "feature-integral": [2.0 ** 64]}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+                  "feature-integral": [2.0 ** 63]}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+                  "feature-integral": ["9223372036854775808"]}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+                  "feature-integral": ["1e3"]}),
+    pa.table({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+              "feature-integral": pa.array([2 ** 64 - 1], pa.uint64())}),
+    pd.DataFrame({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+                  "feature-fractional": ["NaN"]}),
+    pa.table({"record-identifier": ["identifier-1"], "event-time": ["2021-05-06T05:12:14Z"],
+              "feature-fractional": pa.array([float("nan")])}),
+])
+def test_validate_input_data_negative(input_data):
+    with pytest.raises(ValueError, match="Some records contain columns with data types"):
+        validate_input_data(input_data, FEATURE_TYPES, "record-identifier", "event-time")
+
+
+@pytest.mark.parametrize("schema_names,expected_error", [
+    (["record-identifier", "event-time", "unknown"], "Schema contains unknown columns: 'unknown'"),
+    (["record-identifier"], "Missing feature names 'event-time' in schema."),
+    (["record-identifier", "event-time", "year"], "Detected column with reserved feature name 'year'."),
+    (["record-identifier", "event-time", "feature,string"], "Invalid char among"),
+])
+def test_validate_schema_names_negative(schema_names, expected_error):
+    with pytest.raises(ValueError, match=expected_error):
+        validate_schema_names(schema_names, list(FEATURE_TYPES.keys()) + ["year", "feature,string"],
+                              "record-identifier", "event-time")
@@ -34,6 +34,7 @@ import org.apache.spark.sql.types.{
 
 import collection.JavaConverters._
 import org.apache.spark.sql.{DataFrame, Row}
+import org.apache.spark.util.LongAccumulator
 import software.amazon.awssdk.services.sagemaker.model.{
   DescribeFeatureGroupRequest,
   DescribeFeatureGroupResponse,
@@ -41,8 +42,18 @@ import software.amazon.awssdk.services.sagemaker.model.{
   FeatureType
 }
 import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.SageMakerFeatureStoreRuntimeClient
-import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.{FeatureValue, PutRecordRequest, TargetStore}
-import software.amazon.sagemaker.featurestore.sparksdk.exceptions.{StreamIngestionFailureException, ValidationError}
+import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.{
+  DeleteRecordRequest,
+  DeletionMode,
+  FeatureValue,
+  PutRecordRequest,
+  TargetStore
+}
+import software.amazon.sagemaker.featurestore.sparksdk.exceptions.{
+  DeleteRecordsFailureException,
+  StreamIngestionFailureException,
+  ValidationError
+}
 import software.amazon.sagemaker.featurestore.sparksdk.helpers.{
   ClientFactory,
   DataFrameRepartitioner,
@@ -50,7 +61,12 @@ import software.amazon.sagemaker.featurestore.sparksdk.helpers.{
   SparkSessionInitializer
 }
 
+import java.time.Instant
+import java.time.format.DateTimeFormatter
+import java.time.temporal.ChronoUnit
 import java.util
+import java.util.UUID
+import java.util.concurrent.{ConcurrentLinkedQueue, Executors, Semaphore}
 import scala.collection.mutable.ListBuffer
 import scala.util.{Failure, Success, Try}
 
@@ -66,9 +82,13 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
     LongType    -> FeatureType.INTEGRAL
   )
 
+  val DEFAULT_DELETE_RECORD_CONCURRENCY_PER_TASK: Int = 16
+
   private val ONLINE_INGESTION_ERROR_FILED_NAME: String = "online_ingestion_error"
+  private val DELETE_RECORD_ERROR_FIELD_NAME: String   = "delete_record_error"
 
   private var failedStreamIngestionDataFrame: Option[DataFrame] = None
+  private var failedDeleteRecordsDataFrame: Option[DataFrame]   = None
 
   /** Batch ingest data into SageMaker FeatureStore.
    *
@@ -80,43 +100,176 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
    *    choose the target store to ingest the data
    */
   def ingestData(inputDataFrame: DataFrame, featureGroupArn: String, targetStores: List[String] = null): Unit = {
+    ingestDataIntoStores(inputDataFrame, featureGroupArn, targetStores, None, () => ()).foreach(failedDataFrame => {
+      failedStreamIngestionDataFrame = Option(failedDataFrame)
+      verifyStreamIngestionSucceeded(failedDataFrame)
+    })
+  }
+
+  def ingestDataInJava(
+      inputDataFrame: org.apache.spark.sql.Dataset[Row],
+      featureGroupArn: java.lang.String,
+      targetStores: java.util.ArrayList[String] = null
+  ): Unit = {
+    ingestData(inputDataFrame, featureGroupArn, if (targetStores != null) targetStores.asScala.toList else null)
+  }
 
+  /** Asynchronously ingest data into SageMaker FeatureStore.
+   *
+   *  The ingestion runs in its own spark job group and scheduler pool, so ingestion into several feature groups can
+   *  share the cluster at the same time. To share resources fairly between the pools, set 'spark.scheduler.mode' to
+   *  'FAIR'. Ingestions into OfflineStore change the shared spark session configuration before writing data, so they
+   *  are serialized with each other, while ingestions into OnlineStore run concurrently.
+   *
+   *  @param inputDataFrame
+   *    input Spark DataFrame to be ingested.
+   *  @param featureGroupArn
+   *    arn of a feature group.
+   *  @param targetStores
+   *    choose the target store to ingest the data
+   *  @param schedulerPool
+   *    spark scheduler pool to run the ingestion, a pool named after the feature group is used if not specified.
+   *  @param countTotalRecords
+   *    count the input data before ingestion to report progress against the total number of records. Counting is an
+   *    extra pass over the input, so any uncached upstream computation runs twice. If disabled, total records is
+   *    reported as -1 and ingestions only into OfflineStore report no progress.
+   *  @return
+   *    handle of the ingestion job.
+   */
+  def ingestDataAsync(
+      inputDataFrame: DataFrame,
+      featureGroupArn: String,
+      targetStores: List[String] = null,
+      schedulerPool: String = null,
+      countTotalRecords: Boolean = true
+  ): IngestionJob = {
     val featureGroupArnResolver = new FeatureGroupArnResolver(featureGroupArn)
-    val featureGroupName        = featureGroupArn
-    val region                  = featureGroupArnResolver.resolveRegion()
+    val sparkContext            = inputDataFrame.sparkSession.sparkContext
+    val jobGroupId              = s"feature-store-ingestion-${UUID.randomUUID()}"
+    val jobSchedulerPool =
+      if (schedulerPool != null) schedulerPool
+      else s"feature-store-${featureGroupArnResolver.resolveFeatureGroupName()}"
+
+    val job = new IngestionJob(
+      featureGroupArn,
+      jobGroupId,
+      jobSchedulerPool,
+      sparkContext,
+      sparkContext.longAccumulator(s"$jobGroupId-ingested-records")
+    )
 
-    ClientFactory.initialize(region = region, roleArn = assumeRoleArn)
+    job.start(() => {
+      if (countTotalRecords) {
+        job.totalRecords = inputDataFrame.count()
+      }
 
-    val describeResponse = getFeatureGroup(featureGroupName)
+      ingestDataIntoStores(
+        inputDataFrame,
+        featureGroupArn,
+        targetStores,
+        Option(job.ingestedRecordsAccumulator),
+        () => job.checkCancelled()
+      ).foreach(failedDataFrame => {
+        job.failedStreamIngestionDataFrame = failedDataFrame
+        job.checkCancelled()
+        verifyStreamIngestionSucceeded(failedDataFrame)
+      })
+    })
+  }
 
-    checkIfFeatureGroupIsCreated(describeResponse)
-    val parsedTargetStores = checkAndParseTargetStore(describeResponse, targetStores)
+  def ingestDataAsyncInJava(
+      inputDataFrame: org.apache.spark.sql.Dataset[Row],
+      featureGroupArn: java.lang.String,
+      targetStores: java.util.ArrayList[String] = null,
+      schedulerPool: java.lang.String = null,
+      countTotalRecords: Boolean = true
+  ): IngestionJob = {
+    ingestDataAsync(
+      inputDataFrame,
+      featureGroupArn,
+      if (targetStores != null) targetStores.asScala.toList else null,
+      schedulerPool,
+      countTotalRecords
+    )
+  }
 
-    val eventTimeFeatureName = describeResponse.eventTimeFeatureName()
-    val recordIdentifierName = describeResponse.recordIdentifierFeatureName()
+  /** Delete records from SageMaker FeatureStore.
+   *
+   *  @param inputDataFrame
+   *    input Spark DataFrame which contains the record identifiers of records to be deleted, duplicate identifiers are
+   *    only deleted once.
+   *  @param featureGroupArn
+   *    arn of a feature group.
+   *  @param eventTime
+   *    event time of the deletion, current time is used if not specified.
+   *  @param targetStores
+   *    choose the target stores to delete the records from
+   *  @param deletionMode
+   *    choose the deletion mode, either 'SoftDelete' or 'HardDelete'
+   *  @param concurrencyPerTask
+   *    maximum number of DeleteRecord requests in flight within each spark task
+   */
+  def deleteRecords(
+      inputDataFrame: DataFrame,
+      featureGroupArn: String,
+      eventTime: String = null,
+      targetStores: List[String] = null,
+      deletionMode: String = null,
+      concurrencyPerTask: Int = DEFAULT_DELETE_RECORD_CONCURRENCY_PER_TASK
+  ): Unit = {
 
-    if (parsedTargetStores == null || shouldIngestInStream(parsedTargetStores)) {
-      validateSchemaNames(inputDataFrame.schema.names, describeResponse, recordIdentifierName, eventTimeFeatureName)
-      streamIngestIntoOnlineStore(featureGroupName, inputDataFrame, parsedTargetStores, region)
-    } else {
+    if (concurrencyPerTask <= 0) {
+      throw ValidationError(s"Concurrency per task must be positive, however '$concurrencyPerTask' is provided.")
+    }
 
-      val validatedInputDataFrame = validateInputDataFrame(inputDataFrame, describeResponse)
+    val featureGroupArnResolver = new FeatureGroupArnResolver(featureGroupArn)
+    val featureGroupName        = featureGroupArn
+    val region                  = featureGroupArnResolver.resolveRegion()
 
-      batchIngestIntoOfflineStore(
-        validatedInputDataFrame,
-        describeResponse,
-        eventTimeFeatureName,
-        region
+    val describeResponse = describeFeatureGroup(featureGroupArn)
+
+    checkIfFeatureGroupIsCreated(describeResponse)
+    val parsedTargetStores   = checkAndParseTargetStore(describeResponse, targetStores)
+    val parsedDeletionMode   = checkAndParseDeletionMode(deletionMode)
+    val recordIdentifierName = describeResponse.recordIdentifierFeatureName()
+
+    if (!inputDataFrame.schema.names.contains(recordIdentifierName)) {
+      throw ValidationError(
+        s"Cannot proceed. Missing record identifier feature name '$recordIdentifierName' in schema."
       )
     }
+
+    val deletionEventTime =
+      if (eventTime != null) eventTime
+      else DateTimeFormatter.ISO_INSTANT.format(Instant.now().truncatedTo(ChronoUnit.SECONDS))
+
+    deleteRecordsFromStores(
+      featureGroupName,
+      inputDataFrame.select(col(recordIdentifierName)).where(col(recordIdentifierName).isNotNull).distinct(),
+      deletionEventTime,
+      parsedTargetStores,
+      parsedDeletionMode,
+      concurrencyPerTask,
+      region
+    )
   }
 
-  def ingestDataInJava(
+  def deleteRecordsInJava(
       inputDataFrame: org.apache.spark.sql.Dataset[Row],
       featureGroupArn: java.lang.String,
-      targetStores: java.util.ArrayList[String] = null
+      eventTime: java.lang.String = null,
+      targetStores: java.util.ArrayList[String] = null,
+      deletionMode: java.lang.String = null,
+      concurrencyPerTask: java.lang.Integer = null
   ): Unit = {
-    ingestData(inputDataFrame, featureGroupArn, if (targetStores != null) targetStores.asScala.toList else null)
+    deleteRecords(
+      inputDataFrame,
+      featureGroupArn,
+      eventTime,
+      if (targetStores != null) targetStores.asScala.toList else null,
+      deletionMode,
+      if (concurrencyPerTask != null) concurrencyPerTask.intValue() else DEFAULT_DELETE_RECORD_CONCURRENCY_PER_TASK
+    )
   }
 
   /** Load feature definitions according to the schema of input data frame.
@@ -146,6 +299,23 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
     featureDefinitions.asJava
   }
 
+  /** Describe the feature group, including its feature definitions, record identifier and event time feature.
+   *
+   *  @param featureGroupArn
+   *    arn of a feature group.
+   *  @return
+   *    response of DescribeFeatureGroup.
+   */
+  def describeFeatureGroup(featureGroupArn: String): DescribeFeatureGroupResponse = {
+    val region = new FeatureGroupArnResolver(featureGroupArn).resolveRegion()
+
+    // Client factory is shared by ingestions running concurrently, possibly in different regions
+    ClientFactory.synchronized {
+      ClientFactory.initialize(region = region, roleArn = assumeRoleArn)
+      getFeatureGroup(featureGroupArn)
+    }
+  }
+
   /** Get the dataframe which contains failed records during last online ingestion
    *
    *  @return
@@ -155,12 +325,70 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
     failedStreamIngestionDataFrame.orNull
   }
 
+  /** Get the dataframe which contains failed records during last deletion
+   *
+   *  @return
+   *    dataframe which contains records failed to be deleted
+   */
+  def getFailedDeleteRecordsDataFrame: DataFrame = {
+    failedDeleteRecordsDataFrame.orNull
+  }
+
+  private def ingestDataIntoStores(
+      inputDataFrame: DataFrame,
+      featureGroupArn: String,
+      targetStores: List[String],
+      ingestedRecordsAccumulator: Option[LongAccumulator],
+      checkCancelled: () => Unit
+  ): Option[DataFrame] = {
+
+    val featureGroupArnResolver = new FeatureGroupArnResolver(featureGroupArn)
+    val featureGroupName        = featureGroupArn
+    val region                  = featureGroupArnResolver.resolveRegion()
+
+    val describeResponse = describeFeatureGroup(featureGroupArn)
+
+    checkIfFeatureGroupIsCreated(describeResponse)
+    val parsedTargetStores = checkAndParseTargetStore(describeResponse, targetStores)
+
+    val eventTimeFeatureName = describeResponse.eventTimeFeatureName()
+    val recordIdentifierName = describeResponse.recordIdentifierFeatureName()
+
+    if (parsedTargetStores == null || shouldIngestInStream(parsedTargetStores)) {
+      validateSchemaNames(inputDataFrame.schema.names, describeResponse, recordIdentifierName, eventTimeFeatureName)
+      Option(
+        streamIngestIntoOnlineStore(
+          featureGroupName,
+          inputDataFrame,
+          parsedTargetStores,
+          region,
+          ingestedRecordsAccumulator
+        )
+      )
+    } else {
+
+      // Spark jobs submitted after cancellation is requested are not cancelled, so check before each spark action
+      checkCancelled()
+      val validatedInputDataFrame = validateInputDataFrame(inputDataFrame, describeResponse)
+
+      batchIngestIntoOfflineStore(
+        validatedInputDataFrame,
+        describeResponse,
+        eventTimeFeatureName,
+        region,
+        checkCancelled
+      )
+      None
+    }
+  }
+
   private def streamIngestIntoOnlineStore(
       featureGroupName: String,
       inputDataFrame: DataFrame,
       targetStores: List[TargetStore],
-      region: String
-  ): Unit = {
+      region: String,
+      ingestedRecordsAccumulator: Option[LongAccumulator]
+  ): DataFrame = {
     val columns                = inputDataFrame.schema.names
     val repartitionedDataFrame = DataFrameRepartitioner.repartition(inputDataFrame)
 
@@ -173,26 +401,25 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
     // Encoder needs to be defined during transformation because the original schema is changed.
     // The dataframe has to be cached otherwise the input dataset will be re-ingested when customer perform spark
     // actions on failedStreamIngestionDataFrame.
-    failedStreamIngestionDataFrame = Option(
-      repartitionedDataFrame
-        .mapPartitions(partition => {
-          ClientFactory.initialize(region, assumeRoleArn)
-
-          putOnlineRecordsForPartition(
-            partition,
-            featureGroupName,
-            columns,
-            targetStores,
-            ClientFactory.sageMakerFeatureStoreRuntimeClientBuilder.build()
-          )
-        })(SparkRowEncoderAdaptor.encoderFor(castWithExceptionSchema))
-        .filter(row => row.getAs[String](fieldIndexMap(ONLINE_INGESTION_ERROR_FILED_NAME)) != null)
-        .cache()
-    )
+    repartitionedDataFrame
+      .mapPartitions(partition => {
+        putOnlineRecordsForPartition(
+          partition,
+          featureGroupName,
+          columns,
+          targetStores,
+          ingestedRecordsAccumulator,
+          buildFeatureStoreRuntimeClient(region)
+        )
+      })(SparkRowEncoderAdaptor.encoderFor(castWithExceptionSchema))
+      .filter(row => row.getAs[String](fieldIndexMap(ONLINE_INGESTION_ERROR_FILED_NAME)) != null)
+      .cache()
+  }
 
+  private def verifyStreamIngestionSucceeded(failedDataFrame: DataFrame): Unit = {
     // MapPartitions and Map are lazily evaluated by spark, so action is needed here to ensure ingestion is executed
     // For more info: https://spark.apache.org/docs/latest/rdd-programming-guide.html#actions
-    val failedOnlineIngestionDataFrameSize = failedStreamIngestionDataFrame.get.count()
+    val failedOnlineIngestionDataFrameSize = failedDataFrame.count()
 
     if (failedOnlineIngestionDataFrameSize > 0) {
       throw StreamIngestionFailureException(
@@ -201,11 +428,20 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
     }
   }
 
+  private def buildFeatureStoreRuntimeClient(region: String): SageMakerFeatureStoreRuntimeClient = {
+    // Tasks of ingestions into different regions could share the same executor
+    ClientFactory.synchronized {
+      ClientFactory.initialize(region, assumeRoleArn)
+      ClientFactory.sageMakerFeatureStoreRuntimeClientBuilder.build()
+    }
+  }
+
   private def putOnlineRecordsForPartition(
       partition: Iterator[Row],
       featureGroupName: String,
       columns: Array[String],
       targetStores: List[TargetStore],
+      ingestedRecordsAccumulator: Option[LongAccumulator],
       runTimeClient: SageMakerFeatureStoreRuntimeClient
   ): Iterator[Row] = {
     val newPartition = partition.map(row => {
@@ -239,6 +475,7 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
         case Success(value) => null
         case Failure(ex)    => ex.getMessage
       }
+      ingestedRecordsAccumulator.foreach(accumulator => accumulator.add(1))
 
       Row.fromSeq(row.toSeq.toList :+ errorMessage)
     })
@@ -246,11 +483,125 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
     newPartition
   }
 
+  private def deleteRecordsFromStores(
+      featureGroupName: String,
+      identifierDataFrame: DataFrame,
+      eventTime: String,
+      targetStores: List[TargetStore],
+      deletionMode: DeletionMode,
+      concurrencyPerTask: Int,
+      region: String
+  ): Unit = {
+    val repartitionedDataFrame = DataFrameRepartitioner.repartition(identifierDataFrame)
+
+    // Add extra field for reporting deletion failures
+    val deleteWithExceptionSchema = StructType(
+      repartitionedDataFrame.schema.fields ++ Array(StructField(DELETE_RECORD_ERROR_FIELD_NAME, StringType, true))
+    )
+
+    // Only failed records are returned from each partition, the dataframe has to be cached otherwise the records will
+    // be deleted again when customer perform spark actions on failedDeleteRecordsDataFrame.
+    failedDeleteRecordsDataFrame = Option(
+      repartitionedDataFrame
+        .mapPartitions(partition => {
+          deleteRecordsForPartition(
+            partition,
+            featureGroupName,
+            eventTime,
+            targetStores,
+            deletionMode,
+            concurrencyPerTask,
+            buildFeatureStoreRuntimeClient(region)
+          )
+        })(SparkRowEncoderAdaptor.encoderFor(deleteWithExceptionSchema))
+        .cache()
+    )
+
+    val failedDeleteRecordsDataFrameSize = failedDeleteRecordsDataFrame.get.count()
+
+    if (failedDeleteRecordsDataFrameSize > 0) {
+      throw DeleteRecordsFailureException(
+        s"Deletion finished, however ${failedDeleteRecordsDataFrameSize} records failed to be deleted. Please inspect failed delete records data frame for more info."
+      )
+    }
+  }
+
+  private def deleteRecordsForPartition(
+      partition: Iterator[Row],
+      featureGroupName: String,
+      eventTime: String,
+      targetStores: List[TargetStore],
+      deletionMode: DeletionMode,
+      concurrencyPerTask: Int,
+      runTimeClient: SageMakerFeatureStoreRuntimeClient
+  ): Iterator[Row] = {
+    // Runtime client is thread safe, so requests of the same task share the client and are sent by a bounded pool.
+    // The semaphore keeps a sliding window of in flight requests, so a slow or throttled request only holds its own
+    // slot instead of blocking the others.
+    val executorService  = Executors.newFixedThreadPool(concurrencyPerTask)
+    val inFlightRequests = new Semaphore(concurrencyPerTask)
+    val failedRows       = new ConcurrentLinkedQueue[Row]()
+
+    try {
+      partition.foreach(row => {
+        inFlightRequests.acquire()
+        executorService.execute(new Runnable {
+          override def run(): Unit = {
+            try {
+              val errorMessage =
+                deleteRecord(row, featureGroupName, eventTime, targetStores, deletionMode, runTimeClient)
+              if (errorMessage != null) {
+                failedRows.add(Row.fromSeq(row.toSeq.toList :+ errorMessage))
+              }
+            } finally {
+              inFlightRequests.release()
+            }
+          }
+        })
+      })
+
+      // Wait for all in flight requests to finish
+      inFlightRequests.acquire(concurrencyPerTask)
+      failedRows.asScala.toList.iterator
+    } finally {
+      executorService.shutdown()
+    }
+  }
+
+  private def deleteRecord(
+      row: Row,
+      featureGroupName: String,
+      eventTime: String,
+      targetStores: List[TargetStore],
+      deletionMode: DeletionMode,
+      runTimeClient: SageMakerFeatureStoreRuntimeClient
+  ): String = {
+    Try {
+      val deleteRecordRequestBuilder = DeleteRecordRequest
+        .builder()
+        .featureGroupName(featureGroupName)
+        .recordIdentifierValueAsString(row.get(0).toString)
+        .eventTime(eventTime)
+
+      if (targetStores != null) {
+        deleteRecordRequestBuilder.targetStores(targetStores.asJava)
+      }
+      if (deletionMode != null) {
+        deleteRecordRequestBuilder.deletionMode(deletionMode)
+      }
+      runTimeClient.deleteRecord(deleteRecordRequestBuilder.build())
+    } match {
+      case Success(value) => null
+      case Failure(ex)    => ex.getMessage
+    }
+  }
+
   private def batchIngestIntoOfflineStore(
       dataFrame: DataFrame,
       describeResponse: DescribeFeatureGroupResponse,
       eventTimeFeatureName: String,
-      region: String
+      region: String,
+      checkCancelled: () => Unit
   ): Unit = {
 
     if (!isFeatureGroupOfflineStoreEnabled(describeResponse)) {
@@ -274,43 +625,51 @@ class FeatureStoreManager(assumeRoleArn: String = null) extends Serializable {
       val dataBaseName        = describeResponse.offlineStoreConfig().dataCatalogConfig().database().toLowerCase()
       val tableName           = describeResponse.offlineStoreConfig().dataCatalogConfig().tableName().toLowerCase()
 
-      SparkSessionInitializer.initializeSparkSessionForIcebergTable(
-        dataFrame.sparkSession,
-        offlineStoreEncryptionKeyId,
-        resolvedOutputS3Uri,
-        dataCatalogName,
-        assumeRoleArn,
-        region
-      )
-
-      tempDataFrame
-        .sortWithinPartitions(col(eventTimeFeatureName))
-        .writeTo(f"$dataCatalogName.$dataBaseName.`$tableName`")
-        .option("compression", "none")
-        .append()
+      // Spark session configuration is shared by ingestions running concurrently, so it has to stay unchanged until
+      // data is written
+      SparkSessionInitializer.synchronized {
+        checkCancelled()
+        SparkSessionInitializer.initializeSparkSessionForIcebergTable(
+          dataFrame.sparkSession,
+          offlineStoreEncryptionKeyId,
+          resolvedOutputS3Uri,
+          dataCatalogName,
+          assumeRoleArn,
+          region
+        )
+
+        tempDataFrame
+          .sortWithinPartitions(col(eventTimeFeatureName))
+          .writeTo(f"$dataCatalogName.$dataBaseName.`$tableName`")
+          .option("compression", "none")
+          .append()
+      }
     } else if (isGlueTableEnabled(describeResponse) || tableFormat == null) {
-      SparkSessionInitializer.initializeSparkSessionForOfflineStore(
-        dataFrame.sparkSession,
-        offlineStoreEncryptionKeyId,
-        assumeRoleArn,
-        region
-      )
-
-      val offlineDataFrame = tempDataFrame
-        .withColumn("temp_event_time_col", col(eventTimeFeatureName).cast("Timestamp"))
-        .withColumn("year", date_format(col("temp_event_time_col"), "yyyy"))
-        .withColumn("month", date_format(col("temp_event_time_col"), "MM"))
-        .withColumn("day", date_format(col("temp_event_time_col"), "dd"))
-        .withColumn("hour", date_format(col("temp_event_time_col"), "HH"))
-        .drop("temp_event_time_col")
-
-      offlineDataFrame
-        .repartition(col("year"), col("month"), col("day"), col("hour"))
-        .write
-        .partitionBy("year", "month", "day", "hour")
-        .option("compression", "none")
-        .mode("append")
-        .parquet(destinationFilePath)
+      SparkSessionInitializer.synchronized {
+        checkCancelled()
+        SparkSessionInitializer.initializeSparkSessionForOfflineStore(
+          dataFrame.sparkSession,
+          offlineStoreEncryptionKeyId,
+          assumeRoleArn,
+          region
+        )
+
+        val offlineDataFrame = tempDataFrame
+          .withColumn("temp_event_time_col", col(eventTimeFeatureName).cast("Timestamp"))
+          .withColumn("year", date_format(col("temp_event_time_col"), "yyyy"))
+          .withColumn("month", date_format(col("temp_event_time_col"), "MM"))
+          .withColumn("day", date_format(col("temp_event_time_col"), "dd"))
+          .withColumn("hour", date_format(col("temp_event_time_col"), "HH"))
+          .drop("temp_event_time_col")
+
+        offlineDataFrame
+          .repartition(col("year"), col("month"), col("day"), col("hour"))
+          .write
+          .partitionBy("year", "month", "day", "hour")
+          .option("compression", "none")
+          .mode("append")
+          .parquet(destinationFilePath)
+      }
     } else {
       val tableFormat = describeResponse.offlineStoreConfig().tableFormat()
       throw new RuntimeException(
@@ -0,0 +1,200 @@
+/*
+ *  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License").
+ *  You may not use this file except in compliance with the License.
+ *  A copy of the License is located at
+ *
+ *      http://aws.amazon.com/apache2.0
+ *
+ *  or in the "license" file accompanying this file. This file is distributed
+ *  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+ *  express or implied. See the License for the specific language governing
+ *  permissions and limitations under the License.
+ *
+ */
+
+package software.amazon.sagemaker.featurestore.sparksdk
+
+import org.apache.spark.SparkContext
+import org.apache.spark.sql.DataFrame
+import org.apache.spark.util.LongAccumulator
+
+import collection.JavaConverters._
+import java.util
+import java.util.concurrent.{CancellationException, CountDownLatch, TimeUnit}
+
+/** A handle of data ingestion running asynchronously in its own spark job group and scheduler pool.
+ *
+ *  @param featureGroupArn
+ *    arn of the feature group which data is ingested into.
+ *  @param jobGroupId
+ *    id of the spark job group which all spark jobs of the ingestion belong to.
+ *  @param schedulerPool
+ *    spark scheduler pool which all spark jobs of the ingestion are submitted to.
+ */
+class IngestionJob private[sparksdk] (
+    val featureGroupArn: String,
+    val jobGroupId: String,
+    val schedulerPool: String,
+    sparkContext: SparkContext,
+    private[sparksdk] val ingestedRecordsAccumulator: LongAccumulator
+) {
+
+  @volatile private var _status: String                                    = IngestionJob.PENDING
+  @volatile private var _totalRecords: Long                                = -1
+  @volatile private var _failedStreamIngestionDataFrame: Option[DataFrame] = None
+  @volatile private var _error: Option[Throwable]                          = None
+  @volatile private var cancelRequested: Boolean                           = false
+  private val completionLatch                                              = new CountDownLatch(1)
+
+  // Getters
+  def status: String = _status
+
+  /** Number of records to be ingested, -1 if it is not counted yet or counting is disabled.
+   */
+  def totalRecords: Long = _totalRecords
+
+  /** Number of records processed so far. Records ingested directly into OfflineStore are only reported once the
+   *  ingestion succeeds and only if total records are counted. Without the total, records of retried spark tasks
+   *  could be reported more than once.
+   */
+  def ingestedRecords: Long = {
+    if (_status == IngestionJob.SUCCEEDED && _totalRecords >= 0) {
+      _totalRecords
+    } else if (_totalRecords >= 0) {
+      // Retried spark tasks could process the same records twice
+      math.min(ingestedRecordsAccumulator.value, _totalRecords)
+    } else {
+      ingestedRecordsAccumulator.value
+    }
+  }
+
+  def isDone: Boolean = completionLatch.getCount == 0
+
+  def error: Throwable = _error.orNull
+
+  def failedStreamIngestionDataFrame: DataFrame = _failedStreamIngestionDataFrame.orNull
+
+  // Setters
+  private[sparksdk] def totalRecords_=(totalRecords: Long): Unit = _totalRecords = totalRecords
+  private[sparksdk] def failedStreamIngestionDataFrame_=(dataFrame: DataFrame): Unit =
+    _failedStreamIngestionDataFrame = Option(dataFrame)
+
+  /** Get the dataframe which contains failed records of this ingestion
+   *
+   *  @return
+   *    dataframe which contains records failed to be ingested, null if the ingestion is not done or data is not
+   *    ingested into OnlineStore
+   */
+  def getFailedStreamIngestionDataFrame: DataFrame = {
+    failedStreamIngestionDataFrame
+  }
+
+  /** Get the report of this ingestion
+   *
+   *  @return
+   *    status, progress and failure details of the ingestion
+   */
+  def getReport: util.Map[String, String] = {
+    val failedRecords =
+      if (isDone) _failedStreamIngestionDataFrame.map(dataFrame => dataFrame.count().toString).getOrElse("0")
+      else null
+
+    Map(
+      "FeatureGroupArn" -> featureGroupArn,
+      "JobGroupId"      -> jobGroupId,
+      "SchedulerPool"   -> schedulerPool,
+      "Status"          -> status,
+      "TotalRecords"    -> totalRecords.toString,
+      "IngestedRecords" -> ingestedRecords.toString,
+      "FailedRecords"   -> failedRecords,
+      "ErrorMessage"    -> _error.map(error => error.getMessage).orNull
+    ).asJava
+  }
+
+  /** Request cancellation of the ingestion, running spark jobs of the ingestion are cancelled and no further spark
+   *  jobs are submitted. Records already ingested before cancellation are not rolled back, and an ingestion whose
+   *  spark jobs all finish is still reported as succeeded.
+   */
+  def cancel(): Unit = {
+    if (!isDone) {
+      cancelRequested = true
+      sparkContext.cancelJobGroup(jobGroupId)
+    }
+  }
+
+  /** Wait for the ingestion to finish.
+   *
+   *  @param timeoutSeconds
+   *    maximum seconds to wait, wait until the ingestion finishes if it is negative
+   *  @return
+   *    true if the ingestion is done, false if timed out
+   */
+  def awaitCompletion(timeoutSeconds: Long = -1): Boolean = {
+    if (timeoutSeconds < 0) {
+      completionLatch.await()
+      true
+    } else {
+      completionLatch.await(timeoutSeconds, TimeUnit.SECONDS)
+    }
+  }
+
+  /** Wait for the ingestion to finish and rethrow its failure if any.
+   */
+  def result(): Unit = {
+    awaitCompletion()
+    _error.foreach(error => throw error)
+  }
+
+  private[sparksdk] def checkCancelled(): Unit = {
+    if (cancelRequested) {
+      throw new CancellationException(s"Ingestion job '$jobGroupId' is cancelled.")
+    }
+  }
+
+  /** Run the ingestion in a new thread, spark jobs submitted by the ingestion are tagged with the job group and
+   *  scheduler pool of this job.
+   */
+  private[sparksdk] def start(ingest: () => Unit): IngestionJob = {
+    val thread = new Thread(
+      new Runnable {
+        override def run(): Unit = {
+          sparkContext.setLocalProperty(IngestionJob.SCHEDULER_POOL_PROPERTY, schedulerPool)
+          sparkContext.setJobGroup(jobGroupId, s"Ingest data into feature group '$featureGroupArn'")
+
+          try {
+            checkCancelled()
+            _status = IngestionJob.RUNNING
+            ingest()
+            _status = IngestionJob.SUCCEEDED
+          } catch {
+            case e: Throwable =>
+              _error = Option(e)
+              _status = if (cancelRequested) IngestionJob.CANCELLED else IngestionJob.FAILED
+          } finally {
+            sparkContext.clearJobGroup()
+            sparkContext.setLocalProperty(IngestionJob.SCHEDULER_POOL_PROPERTY, null)
+            completionLatch.countDown()
+          }
+        }
+      },
+      jobGroupId
+    )
+    thread.setDaemon(true)
+    thread.start()
+
+    this
+  }
+}
+
+object IngestionJob {
+
+  val PENDING: String   = "Pending"
+  val RUNNING: String   = "Running"
+  val SUCCEEDED: String = "Succeeded"
+  val FAILED: String    = "Failed"
+  val CANCELLED: String = "Cancelled"
+
+  private val SCHEDULER_POOL_PROPERTY: String = "spark.scheduler.pool"
+}
@@ -17,7 +17,7 @@
 package software.amazon.sagemaker.featurestore.sparksdk.helpers
 
 import software.amazon.awssdk.services.sagemaker.model.{DescribeFeatureGroupResponse, FeatureGroupStatus, TableFormat}
-import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.TargetStore
+import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.{DeletionMode, TargetStore}
 import software.amazon.sagemaker.featurestore.sparksdk.exceptions.ValidationError
 
 import scala.collection.mutable.ListBuffer
@@ -100,6 +100,32 @@ object FeatureGroupHelper {
     parsedStores.toList
   }
 
+  /** Check if deletion mode is valid.
+   *
+   *  @param deletionMode
+   *    deletion mode of DeleteRecord, either 'SoftDelete' or 'HardDelete'.
+   *  @return
+   *    parsed deletion mode, null if deletion mode is not specified.
+   */
+  def checkAndParseDeletionMode(deletionMode: String): DeletionMode = {
+
+    // Skip the check if deletion mode is null, then DeleteRecord falls back to its default mode
+
+    if (deletionMode == null) {
+      return null
+    }
+
+    val parsedDeletionMode = DeletionMode.fromValue(deletionMode)
+
+    if (parsedDeletionMode == null || parsedDeletionMode == DeletionMode.UNKNOWN_TO_SDK_VERSION) {
+      throw ValidationError(
+        s"Found unknown deletion mode, the valid values are [${DeletionMode.knownValues().toArray.mkString(", ")}]."
+      )
+    }
+
+    parsedDeletionMode
+  }
+
   /** Check if FeatureGruop has OnlineStore enabled.
    *
    *  @param describeResponse
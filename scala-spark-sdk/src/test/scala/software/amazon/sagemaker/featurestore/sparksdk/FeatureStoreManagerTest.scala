@@ -4,9 +4,11 @@ import collection.JavaConverters._
 import org.apache.spark.sql.functions.col
 import org.apache.spark.sql.{DataFrame, SparkSession}
 import org.mockito.ArgumentMatchers.{any, anyString}
-import org.mockito.Mockito.doNothing
+import org.mockito.Mockito.{clearInvocations, doNothing}
 import org.mockito.MockitoSugar.{times, verify, when, withObjectMocked}
 import org.mockito.captor.ArgCaptor
+import org.mockito.invocation.InvocationOnMock
+import org.mockito.stubbing.Answer
 import org.scalatest.Matchers.convertToAnyShouldWrapper
 import org.scalatest.PrivateMethodTester
 import org.scalatestplus.mockito.MockitoSugar.mock
@@ -27,6 +29,9 @@ import software.amazon.awssdk.services.sagemaker.model.{
   TableFormat
 }
 import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.{
+  DeleteRecordRequest,
+  DeleteRecordResponse,
+  DeletionMode,
   FeatureValue,
   PutRecordRequest,
   PutRecordResponse,
@@ -36,10 +41,15 @@ import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.{
   SageMakerFeatureStoreRuntimeClient,
   SageMakerFeatureStoreRuntimeClientBuilder
 }
-import software.amazon.sagemaker.featurestore.sparksdk.exceptions.{StreamIngestionFailureException, ValidationError}
+import software.amazon.sagemaker.featurestore.sparksdk.exceptions.{
+  DeleteRecordsFailureException,
+  StreamIngestionFailureException,
+  ValidationError
+}
 import software.amazon.sagemaker.featurestore.sparksdk.helpers.{ClientFactory, SparkSessionInitializer}
 
 import java.io.File
+import java.util.concurrent.{CancellationException, CountDownLatch}
 import scala.reflect.io.Directory
 
 class FeatureStoreManagerTest extends TestNGSuite with PrivateMethodTester {
@@ -61,6 +71,7 @@ class FeatureStoreManagerTest extends TestNGSuite with PrivateMethodTester {
   private final val mockedSageMakerClient                           = mock[SageMakerClient]
   private final val mockedSageMakerFeatureStoreRuntimeClient        = mock[SageMakerFeatureStoreRuntimeClient]
   private final val putRecordRequestCaptor                          = ArgCaptor[PutRecordRequest]
+  private final val deleteRecordRequestCaptor                       = ArgCaptor[DeleteRecordRequest]
 
   @BeforeMethod
   def setup(): Unit = {
@@ -71,6 +82,8 @@ class FeatureStoreManagerTest extends TestNGSuite with PrivateMethodTester {
     when(mockedSageMakerFeatureStoreRuntimeClientBuilder.build()).thenReturn(mockedSageMakerFeatureStoreRuntimeClient)
     when(mockedSageMakerFeatureStoreRuntimeClient.putRecord(any(classOf[PutRecordRequest])))
       .thenReturn(PutRecordResponse.builder().build())
+    when(mockedSageMakerFeatureStoreRuntimeClient.deleteRecord(any(classOf[DeleteRecordRequest])))
+      .thenReturn(DeleteRecordResponse.builder().build())
   }
 
   @Test(dataProvider = "ingestDataStreamOnlineStoreTestDataProvider")
@@ -368,6 +381,201 @@ class FeatureStoreManagerTest extends TestNGSuite with PrivateMethodTester {
     }
   }
 
+  @Test
+  def describeFeatureGroupTest(): Unit = {
+    val response = buildOnlineStoreDescribeResponse()
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest]))).thenReturn(response)
+
+    assertEquals(featureStoreManager.describeFeatureGroup(TEST_FEATURE_GROUP_ARN), response)
+  }
+
+  @Test(expectedExceptions = Array(classOf[ValidationError]))
+  def describeFeatureGroupInvalidArnTest(): Unit = {
+    featureStoreManager.describeFeatureGroup("test-feature-group")
+  }
+
+  @Test
+  def ingestDataAsyncTest(): Unit = {
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenReturn(buildOnlineStoreDescribeResponse())
+
+    val inputDataFrame = Seq(("identifier-1", "2021-05-06T05:12:14Z"), ("identifier-2", "2021-05-06T05:12:14Z"))
+      .toDF("record-identifier", "event-time")
+
+    val ingestionJob = featureStoreManager.ingestDataAsync(inputDataFrame, TEST_FEATURE_GROUP_ARN, List("OnlineStore"))
+    ingestionJob.result()
+
+    assertEquals(ingestionJob.status, IngestionJob.SUCCEEDED)
+    assertEquals(ingestionJob.schedulerPool, "feature-store-test-feature-group")
+    assertEquals(ingestionJob.totalRecords, 2)
+    assertEquals(ingestionJob.ingestedRecords, 2)
+    assertEquals(ingestionJob.getFailedStreamIngestionDataFrame.count(), 0)
+    assertEquals(ingestionJob.getReport.get("Status"), IngestionJob.SUCCEEDED)
+    assertEquals(ingestionJob.getReport.get("FailedRecords"), "0")
+
+    // Cancelling a finished ingestion has no effect
+    ingestionJob.cancel()
+    ingestionJob.result()
+    assertEquals(ingestionJob.status, IngestionJob.SUCCEEDED)
+  }
+
+  @Test
+  def ingestDataAsyncWithFailuresTest(): Unit = {
+    when(mockedSageMakerFeatureStoreRuntimeClient.putRecord(any(classOf[PutRecordRequest])))
+      .thenThrow(new RuntimeException("test error"))
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenReturn(buildOnlineStoreDescribeResponse())
+
+    val inputDataFrame = Seq(("identifier-1", "2021-05-06T05:12:14Z")).toDF("record-identifier", "event-time")
+
+    val ingestionJob =
+      featureStoreManager.ingestDataAsync(inputDataFrame, TEST_FEATURE_GROUP_ARN, List("OnlineStore"), "test-pool")
+
+    intercept[StreamIngestionFailureException] {
+      ingestionJob.result()
+    }
+
+    assertEquals(ingestionJob.status, IngestionJob.FAILED)
+    assertEquals(ingestionJob.schedulerPool, "test-pool")
+    assertEquals(ingestionJob.getFailedStreamIngestionDataFrame.count(), 1)
+    assertEquals(
+      ingestionJob.getFailedStreamIngestionDataFrame.first().getAs[String]("online_ingestion_error"),
+      "test error"
+    )
+    assertEquals(ingestionJob.getReport.get("FailedRecords"), "1")
+  }
+
+  @Test
+  def ingestDataAsyncWithoutCountingTest(): Unit = {
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenReturn(buildOnlineStoreDescribeResponse())
+
+    val inputDataFrame = Seq(("identifier-1", "2021-05-06T05:12:14Z"), ("identifier-2", "2021-05-06T05:12:14Z"))
+      .toDF("record-identifier", "event-time")
+
+    val ingestionJob = featureStoreManager.ingestDataAsync(
+      inputDataFrame,
+      TEST_FEATURE_GROUP_ARN,
+      List("OnlineStore"),
+      countTotalRecords = false
+    )
+    ingestionJob.result()
+
+    assertEquals(ingestionJob.status, IngestionJob.SUCCEEDED)
+    assertEquals(ingestionJob.totalRecords, -1)
+    assertEquals(ingestionJob.ingestedRecords, 2)
+  }
+
+  @Test
+  def ingestDataAsyncCancelTest(): Unit = {
+    val describeStarted = new CountDownLatch(1)
+    val cancelRequested = new CountDownLatch(1)
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenAnswer(new Answer[DescribeFeatureGroupResponse] {
+        override def answer(invocation: InvocationOnMock): DescribeFeatureGroupResponse = {
+          describeStarted.countDown()
+          cancelRequested.await()
+          buildOnlineStoreDescribeResponse()
+        }
+      })
+    clearInvocations(mockedSageMakerFeatureStoreRuntimeClient)
+
+    val inputDataFrame = Seq(("identifier-1", "2021-05-06T05:12:14Z")).toDF("record-identifier", "event-time")
+
+    val ingestionJob = featureStoreManager.ingestDataAsync(
+      inputDataFrame,
+      TEST_FEATURE_GROUP_ARN,
+      List("OnlineStore"),
+      countTotalRecords = false
+    )
+
+    // Cancel before any spark job of the ingestion is submitted
+    describeStarted.await()
+    ingestionJob.cancel()
+    cancelRequested.countDown()
+
+    intercept[CancellationException] {
+      ingestionJob.result()
+    }
+
+    assertEquals(ingestionJob.status, IngestionJob.CANCELLED)
+    assertEquals(ingestionJob.isDone, true)
+    verify(mockedSageMakerFeatureStoreRuntimeClient, times(0)).putRecord(any(classOf[PutRecordRequest]))
+  }
+
+  @Test
+  def deleteRecordsTest(): Unit = {
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenReturn(buildOnlineStoreDescribeResponse())
+    clearInvocations(mockedSageMakerFeatureStoreRuntimeClient)
+
+    val inputDataFrame = Seq("identifier-1", "identifier-2", "identifier-1", null).toDF("record-identifier")
+
+    featureStoreManager.deleteRecords(
+      inputDataFrame,
+      TEST_FEATURE_GROUP_ARN,
+      "2021-05-06T05:12:14Z",
+      List("OnlineStore"),
+      "HardDelete",
+      concurrencyPerTask = 1
+    )
+
+    // Duplicate and null identifiers should not be deleted
+    verify(mockedSageMakerFeatureStoreRuntimeClient, times(2)).deleteRecord(deleteRecordRequestCaptor)
+    assertEquals(
+      deleteRecordRequestCaptor.values.map(request => request.recordIdentifierValueAsString()).toSet,
+      Set("identifier-1", "identifier-2")
+    )
+    deleteRecordRequestCaptor.values.foreach(request => {
+      assertEquals(request.featureGroupName(), TEST_FEATURE_GROUP_ARN)
+      assertEquals(request.eventTime(), "2021-05-06T05:12:14Z")
+      assertEquals(request.targetStores(), List(TargetStore.ONLINE_STORE).asJava)
+      assertEquals(request.deletionMode(), DeletionMode.HARD_DELETE)
+    })
+
+    assertEquals(featureStoreManager.getFailedDeleteRecordsDataFrame.count(), 0)
+  }
+
+  @Test
+  def deleteRecordsWithFailuresTest(): Unit = {
+    when(mockedSageMakerFeatureStoreRuntimeClient.deleteRecord(any(classOf[DeleteRecordRequest])))
+      .thenThrow(new RuntimeException("test error"))
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenReturn(buildOnlineStoreDescribeResponse())
+
+    val inputDataFrame = Seq(("identifier-1", "2021-05-06T05:12:14Z"), ("identifier-2", "2021-05-06T05:12:14Z"))
+      .toDF("record-identifier", "event-time")
+
+    val caught = intercept[DeleteRecordsFailureException] {
+      featureStoreManager.deleteRecords(inputDataFrame, TEST_FEATURE_GROUP_ARN)
+    }
+
+    caught.message shouldBe "Deletion finished, however 2 records failed to be deleted. Please inspect failed delete records data frame for more info."
+
+    val failedDeleteRecordsDataFrame = featureStoreManager.getFailedDeleteRecordsDataFrame
+
+    assertEquals(failedDeleteRecordsDataFrame.schema.names.toList, List("record-identifier", "delete_record_error"))
+    assertEquals(failedDeleteRecordsDataFrame.count(), 2)
+    assertEquals(failedDeleteRecordsDataFrame.first().getAs[String]("delete_record_error"), "test error")
+  }
+
+  @Test(expectedExceptions = Array(classOf[ValidationError]))
+  def deleteRecordsInvalidConcurrencyTest(): Unit = {
+    featureStoreManager.deleteRecords(
+      Seq("identifier-1").toDF("record-identifier"),
+      TEST_FEATURE_GROUP_ARN,
+      concurrencyPerTask = 0
+    )
+  }
+
+  @Test(expectedExceptions = Array(classOf[ValidationError]))
+  def deleteRecordsMissingRecordIdentifierTest(): Unit = {
+    when(mockedSageMakerClient.describeFeatureGroup(any(classOf[DescribeFeatureGroupRequest])))
+      .thenReturn(buildOnlineStoreDescribeResponse())
+
+    featureStoreManager.deleteRecords(Seq("2021-05-06T05:12:14Z").toDF("event-time"), TEST_FEATURE_GROUP_ARN)
+  }
+
   @Test(dataProvider = "loadFeatureDefinitionsFromSchemaTestDataProvider")
   def loadFeatureDefinitionsFromSchemaTest(
       inputDataFrame: DataFrame,
@@ -478,6 +686,34 @@ class FeatureStoreManagerTest extends TestNGSuite with PrivateMethodTester {
     )
   }
 
+  def buildOnlineStoreDescribeResponse(): DescribeFeatureGroupResponse = {
+    DescribeFeatureGroupResponse
+      .builder()
+      .featureGroupArn(TEST_FEATURE_GROUP_ARN)
+      .featureGroupStatus(FeatureGroupStatus.CREATED)
+      .eventTimeFeatureName("event-time")
+      .recordIdentifierFeatureName("record-identifier")
+      .featureDefinitions(
+        FeatureDefinition
+          .builder()
+          .featureName("record-identifier")
+          .featureType(FeatureType.STRING)
+          .build(),
+        FeatureDefinition
+          .builder()
+          .featureName("event-time")
+          .featureType(FeatureType.STRING)
+          .build()
+      )
+      .onlineStoreConfig(
+        OnlineStoreConfig
+          .builder()
+          .enableOnlineStore(true)
+          .build()
+      )
+      .build()
+  }
+
   def verifyDataIngestedInOfflineStore(
       inputDataFrame: DataFrame,
       resolvedOutputPath: String
@@ -11,7 +11,7 @@ import software.amazon.awssdk.services.sagemaker.model.{
   S3StorageConfig,
   TableFormat
 }
-import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.TargetStore
+import software.amazon.awssdk.services.sagemakerfeaturestoreruntime.model.{DeletionMode, TargetStore}
 import software.amazon.sagemaker.featurestore.sparksdk.exceptions.ValidationError
 
 class FeatureGroupHelperTest extends TestNGSuite {
@@ -64,6 +64,19 @@ class FeatureGroupHelperTest extends TestNGSuite {
     assertEquals(caught.message, expectedErrorMessage)
   }
 
+  @Test(dataProvider = "checkAndParseDeletionModeTestPositiveDataProvider")
+  def checkAndParseDeletionModeTest_positive(
+      deletionMode: String,
+      expectedDeletionMode: DeletionMode
+  ): Unit = {
+    assertEquals(FeatureGroupHelper.checkAndParseDeletionMode(deletionMode), expectedDeletionMode)
+  }
+
+  @Test(expectedExceptions = Array(classOf[ValidationError]))
+  def checkAndParseDeletionModeTest_negative(): Unit = {
+    FeatureGroupHelper.checkAndParseDeletionMode("InvalidDelete")
+  }
+
   @Test(dataProvider = "retrieveTargetStoresFromFeatureGroupTestDataProvider")
   def retrieveTargetStoresFromFeatureGroupTest(
       response: DescribeFeatureGroupResponse,
@@ -129,6 +142,15 @@ class FeatureGroupHelperTest extends TestNGSuite {
     assertEquals(FeatureGroupHelper.isGlueTableEnabled(describeResponse), expectedResult)
   }
 
+  @DataProvider
+  def checkAndParseDeletionModeTestPositiveDataProvider(): Array[Array[Any]] = {
+    Array(
+      Array(null, null),
+      Array("SoftDelete", DeletionMode.SOFT_DELETE),
+      Array("HardDelete", DeletionMode.HARD_DELETE)
+    )
+  }
+
   @DataProvider
   def featureGroupOnlineStoreEnabledTestDataProvider(): Array[Array[Any]] = {
     Array(